@@ -8,6 +8,9 @@ function createCameraController(app) {
     CameraController.MODE_FOLLOW = 2;
     CameraController.MODE_FPV = 3;
     
+    // Display labels, indexed by camera mode
+    CameraController.MODE_LABELS = ["Free Orbit", "Top View", "Follow", "First Person"];
+    
     // Configuration attributes
     CameraController.attributes.add('droneEntity', { type: 'entity' });
     CameraController.attributes.add('distance', { type: 'number', default: 15 });
@@ -15,6 +18,7 @@ function createCameraController(app) {
     CameraController.attributes.add('orbitSensitivity', { type: 'number', default: 0.3 });
     CameraController.attributes.add('panSensitivity', { type: 'number', default: 0.1 });
     CameraController.attributes.add('zoomSensitivity', { type: 'number', default: 0.2 });
+    CameraController.attributes.add('debugLogging', { type: 'boolean', default: false });
     
     // Initialize
     CameraController.prototype.initialize = function() {
@@ -28,6 +32,12 @@ function createCameraController(app) {
         this.pitch = -45;  
         this.currentDistance = 25;
         
+        // Scratch vectors reused by the per-frame camera updates
+        this._position = new pc.Vec3();
+        this._offset = new pc.Vec3();
+        this._panRight = new pc.Vec3();
+        this._panUp = new pc.Vec3();
+        
         // Find drone if not set
         if (!this.droneEntity) {
             this.droneEntity = this.app.root.findByName('Drone');
@@ -57,6 +67,10 @@ function createCameraController(app) {
         
         // Add debug UI to show orbit angles
         this.createDebugDisplay();
+        
+        // Refresh the debug display at ~10 Hz rather than every frame
+        this.debugUpdateInterval = 0.1;
+        this.debugUpdateTimer = 0;
     };
     
     // Create debug display for orbital parameters
@@ -73,6 +87,14 @@ function createCameraController(app) {
         this.debugDisplay.style.pointerEvents = 'none';
         this.debugDisplay.style.textAlign = 'right';
         this.debugDisplay.style.borderRadius = '4px';
+
+        // Build one line per value once, then only their text changes on update
+        this.debugFields = {};
+        ['mode', 'yaw', 'pitch', 'distance', 'camera'].forEach(name => {
+            const line = document.createElement('div');
+            this.debugDisplay.appendChild(line);
+            this.debugFields[name] = line;
+        });
         document.body.appendChild(this.debugDisplay);
         
         // Update debug display with current orbital parameters
@@ -83,25 +105,23 @@ function createCameraController(app) {
     CameraController.prototype.updateDebugDisplay = function() {
         if (!this.debugDisplay) return;
         
+        // Update text in place, skipping lines whose value hasn't changed
+        const setText = (line, text) => {
+            if (line.textContent !== text) line.textContent = text;
+        };
+        
         const pos = this.entity.getPosition();
-        this.debugDisplay.innerHTML = `
-            Mode: ${this.getModeLabel()}<br>
-            Yaw: ${this.yaw.toFixed(1)}°<br>
-            Pitch: ${this.pitch.toFixed(1)}°<br>
-            Distance: ${this.currentDistance.toFixed(1)}<br>
-            Camera: (${pos.x.toFixed(1)}, ${pos.y.toFixed(1)}, ${pos.z.toFixed(1)})
-        `;
+        const fields = this.debugFields;
+        setText(fields.mode, `Mode: ${this.getModeLabel()}`);
+        setText(fields.yaw, `Yaw: ${this.yaw.toFixed(1)}°`);
+        setText(fields.pitch, `Pitch: ${this.pitch.toFixed(1)}°`);
+        setText(fields.distance, `Distance: ${this.currentDistance.toFixed(1)}`);
+        setText(fields.camera, `Camera: (${pos.x.toFixed(1)}, ${pos.y.toFixed(1)}, ${pos.z.toFixed(1)})`);
     };
     
     // Get mode label for display
     CameraController.prototype.getModeLabel = function() {
-        switch (this.mode) {
-            case CameraController.MODE_FREE: return "Free Orbit";
-            case CameraController.MODE_TOP: return "Top View";
-            case CameraController.MODE_FOLLOW: return "Follow";
-            case CameraController.MODE_FPV: return "First Person";
-            default: return "Unknown";
-        }
+        return CameraController.MODE_LABELS[this.mode] || "Unknown";
     };
     
     // FIXED starting position that works reliably
@@ -199,7 +219,7 @@ function createCameraController(app) {
                     
                     // Allow full vertical rotation with minor constraint to prevent gimbal lock
                     // Allow looking from any angle above or below
-                    this.pitch = Math.max(-89.9, Math.min(89.9, this.pitch + dy * this.orbitSensitivity));
+                    this.pitch = pc.math.clamp(this.pitch + dy * this.orbitSensitivity, -89.9, 89.9);
                     
                     // Update camera position based on new angles
                     this.updateFreeCameraPosition();
@@ -263,7 +283,7 @@ function createCameraController(app) {
                 const zoomSpeed = Math.max(0.5, this.currentDistance * 0.05);
                 
                 // Update distance
-                this.currentDistance = Math.max(1, Math.min(100, this.currentDistance + delta * zoomSpeed));
+                this.currentDistance = pc.math.clamp(this.currentDistance + delta * zoomSpeed, 1, 100);
                 
                 // Update camera position
                 this.updateFreeCameraPosition();
@@ -283,8 +303,8 @@ function createCameraController(app) {
         const rot = this.entity.getRotation();
         
         // Get right and up vectors
-        const right = new pc.Vec3();
-        const up = new pc.Vec3(0, 1, 0);
+        const right = this._panRight;
+        const up = this._panUp.set(0, 1, 0);
         
         // Extract right vector from rotation matrix
         rot.transformVector(pc.Vec3.RIGHT, right);
@@ -312,7 +332,7 @@ function createCameraController(app) {
         const z = Math.cos(yawRad) * Math.cos(pitchRad);
         
         // Scale by distance and offset by target position
-        const position = new pc.Vec3(
+        const position = this._position.set(
             this.targetPosition.x + x * this.currentDistance,
             this.targetPosition.y + y * this.currentDistance,
             this.targetPosition.z + z * this.currentDistance
@@ -344,7 +364,6 @@ function createCameraController(app) {
             // Smoothly update target to follow drone
             const dronePos = this.droneEntity.getPosition();
             this.targetPosition.lerp(this.targetPosition, dronePos, dt * 2);
-            this.updateFreeCameraPosition();
         }
         
         // Update camera based on current mode
@@ -353,6 +372,9 @@ function createCameraController(app) {
                 // Most free camera controls handled by mouse events
                 // Handle keyboard fallbacks
                 this.updateFreeCameraKeyboard(dt);
+                
+                // Apply drone tracking and keyboard changes in a single pass
+                this.updateFreeCameraPosition();
                 break;
                 
             case CameraController.MODE_TOP:
@@ -368,8 +390,10 @@ function createCameraController(app) {
                 break;
         }
         
-        // Occasionally update debug display
-        if (Math.random() < 0.05) {
+        // Update debug display at a fixed rate
+        this.debugUpdateTimer += dt;
+        if (this.debugUpdateTimer >= this.debugUpdateInterval) {
+            this.debugUpdateTimer = 0;
             this.updateDebugDisplay();
         }
     };
@@ -420,12 +444,6 @@ function createCameraController(app) {
         if (this.keyboard.isPressed(pc.KEY_O)) {
             this.currentDistance = Math.min(100, this.currentDistance + zoomSpeed);
         }
-        
-        // Update position
-        this.updateFreeCameraPosition();
-        
-        // Update debug display
-        this.updateDebugDisplay();
     };
     
     // Set camera mode
@@ -488,8 +506,6 @@ function createCameraController(app) {
         const dronePos = this.droneEntity.getPosition();
         this.entity.setPosition(dronePos.x, dronePos.y + 15, dronePos.z);
         this.entity.setEulerAngles(90, 0, 0);
-        
-        this.updateDebugDisplay();
     };
     
     // Update follow view camera
@@ -501,7 +517,7 @@ function createCameraController(app) {
         
         // In PlayCanvas, forward is negative Z, so to be "behind" we need negative Z
         // This positions the camera behind the drone in world space
-        const offset = new pc.Vec3(0, this.height, -10);
+        const offset = this._offset.set(0, this.height, -10);
         droneRot.transformVector(offset, offset);
         
         // Position camera
@@ -514,12 +530,10 @@ function createCameraController(app) {
         // Look back at the drone (from behind)
         this.entity.lookAt(dronePos);
         
-        // Log position for debugging
-        if (Math.random() < 0.01) {
+        // Log position for debugging (opt-in, this runs every frame)
+        if (this.debugLogging && Math.random() < 0.01) {
             console.log("Follow camera position:", this.entity.getPosition(), "Drone position:", dronePos);
         }
-        
-        this.updateDebugDisplay();
     };
     
     // Update first person view
@@ -530,7 +544,7 @@ function createCameraController(app) {
         const droneRot = this.droneEntity.getRotation();
         
         // First person position
-        const offset = new pc.Vec3(0, 0.5, 0);
+        const offset = this._offset.set(0, 0.5, 0);
         droneRot.transformVector(offset, offset);
         
         this.entity.setPosition(
@@ -540,8 +554,6 @@ function createCameraController(app) {
         );
         
         this.entity.setRotation(droneRot);
-        
-        this.updateDebugDisplay();
     };
     
     // Clean up when script is destroyed
@@ -25,6 +25,9 @@ function createDroneController(app) {
         // State tracking - we'll consider flying if we're above ground level
         this.isFlying = false;
         this._moveDir = new pc.Vec3();
+        this._propAxis = new pc.Vec3(0, 1, 0);
+        this._propDelta = new pc.Quat();
+        this._propRot = new pc.Quat();
         
         // Animation components
         this.findAnimationComponents();
@@ -111,26 +114,25 @@ function createDroneController(app) {
         this.isFlying = this.entity.getPosition().y > this.groundHeight + 0.1;
     };
     
+    // Read a -1/0/+1 input axis from a pair of keys
+    DroneController.prototype.readAxis = function(positiveKey, negativeKey) {
+        let value = 0;
+        if (this.keyboard.isPressed(positiveKey)) value += 1;
+        if (this.keyboard.isPressed(negativeKey)) value -= 1;
+        return value;
+    };
+    
     DroneController.prototype.processInput = function(dt) {
         // Directly map keys to expected directions
-        let forwardInput = 0;
-        if (this.keyboard.isPressed(pc.KEY_S)) forwardInput += 1;
-        if (this.keyboard.isPressed(pc.KEY_W)) forwardInput -= 1;
-        
-        let rightInput = 0;
-        if (this.keyboard.isPressed(pc.KEY_A)) rightInput += 1;
-        if (this.keyboard.isPressed(pc.KEY_D)) rightInput -= 1;
+        const forwardInput = this.readAxis(pc.KEY_S, pc.KEY_W);
+        const rightInput = this.readAxis(pc.KEY_A, pc.KEY_D);
         
         // For yaw, Q = left rotation, E = right rotation
-        let yawInput = 0;
-        if (this.keyboard.isPressed(pc.KEY_Q)) yawInput += 1;
-        if (this.keyboard.isPressed(pc.KEY_E)) yawInput -= 1;
+        const yawInput = this.readAxis(pc.KEY_Q, pc.KEY_E);
         
         // NEW DIRECT VERTICAL CONTROL:
         // Space = Up, Shift = Down
-        let verticalInput = 0;
-        if (this.keyboard.isPressed(pc.KEY_SPACE)) verticalInput += 1;
-        if (this.keyboard.isPressed(pc.KEY_SHIFT)) verticalInput -= 1;
+        const verticalInput = this.readAxis(pc.KEY_SPACE, pc.KEY_SHIFT);
         
         // Update orientation
         if (yawInput !== 0) {
@@ -254,11 +256,12 @@ function createDroneController(app) {
                 const propeller = this.propellerEntities[i];
                 const direction = (i % 2 === 0) ? 1 : -1;
                 
+                // Reuse scratch quaternions instead of allocating per propeller per frame
                 const currentRot = propeller.getLocalRotation();
                 const rotAngle = rotSpeed * direction;
-                const rotDelta = new pc.Quat().setFromAxisAngle(new pc.Vec3(0, 1, 0), rotAngle);
-                const newRot = rotDelta.mul(currentRot);
-                propeller.setLocalRotation(newRot);
+                this._propDelta.setFromAxisAngle(this._propAxis, rotAngle);
+                this._propRot.mul2(this._propDelta, currentRot);
+                propeller.setLocalRotation(this._propRot);
             }
         }
     };
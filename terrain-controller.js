@@ -297,16 +297,16 @@ function createTerrainController(app) {
         const endPos = this.endPosition;
         
         // Check if drone is close to end position and has landed
-        const distance = Math.sqrt(
-            Math.pow(dronePos.x - endPos.x, 2) + 
-            Math.pow(dronePos.z - endPos.z, 2)
-        );
+        // (compare squared distances to avoid a square root every frame)
+        const dx = dronePos.x - endPos.x;
+        const dz = dronePos.z - endPos.z;
+        const distanceSq = dx * dx + dz * dz;
         
         const isLanded = droneEntity.script && 
                          droneEntity.script.droneController && 
                          droneEntity.script.droneController.isLanded();
         
-        if (distance < 2.5 && isLanded) {
+        if (distanceSq < 2.5 * 2.5 && isLanded) {
             this.completeMission();
         }
     };
@@ -471,10 +471,13 @@ function createTerrainController(app) {
     
     // Update called every frame
     TerrainController.prototype.update = function(dt) {
-        // Find drone if it exists
-        const drone = app.root.findByName('Drone');
-        if (drone) {
-            this.checkMissionComplete(drone);
+        // Find drone once and cache it rather than searching the scene graph every frame
+        if (!this.droneEntity) {
+            this.droneEntity = app.root.findByName('Drone');
+        }
+        // Skip the landing check entirely once the mission is done
+        if (this.droneEntity && !app.globals.missionComplete) {
+            this.checkMissionComplete(this.droneEntity);
         }
         
         // Handle mission complete text pulsing